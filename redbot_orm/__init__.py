@@ -1,7 +1,34 @@
+import os
+
 from .errors import ConnectionTimeoutError, DirectoryError, UNCPathError
 
 __all__ = [
     "ConnectionTimeoutError",
     "DirectoryError",
     "UNCPathError",
+    "install_uvloop",
 ]
+
+
+def install_uvloop() -> bool:
+    """Install uvloop as the asyncio event loop policy if available.
+
+    Everything this package does is asyncio I/O, and asyncpg is specifically
+    tuned for uvloop. This must run before the bot creates its event loop.
+
+    Returns:
+        bool: True if uvloop was installed, False if it isn't available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        # Not installed, or an unsupported platform like Windows
+        return False
+    uvloop.install()
+    return True
+
+
+# Runs at import time so it lands before discord.py bootstraps the loop.
+# Set REDORM_UVLOOP=0 to opt out.
+if os.getenv("REDORM_UVLOOP", "1") == "1":
+    install_uvloop()
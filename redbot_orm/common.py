@@ -1,19 +1,55 @@
 import asyncio
+import contextlib
+import functools
 import inspect
+import io
 import os
-import subprocess
+import re
 import sys
+import tempfile
+import traceback
+import weakref
+from collections import deque
 from pathlib import Path
 
 from discord.ext import commands
 from redbot.core.data_manager import cog_data_path
 
+try:
+    from piccolo.apps.migrations.commands.backwards import (
+        backwards as piccolo_backwards,
+    )
+    from piccolo.apps.migrations.commands.check import check as piccolo_check
+    from piccolo.apps.migrations.commands.forwards import forwards as piccolo_forwards
+    from piccolo.apps.migrations.commands.new import new as piccolo_new
+    from piccolo.conf.apps import Finder
+
+    PICCOLO_API_AVAILABLE = True
+except ImportError:
+    # Piccolo version without these entrypoints, fall back to the CLI
+    PICCOLO_API_AVAILABLE = False
+    piccolo_backwards = piccolo_check = piccolo_forwards = piccolo_new = None
+    Finder = None
+
+
+# Weak keys so cached paths don't keep unloaded cog instances alive
+_root_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
 def get_root(cog_instance: commands.Cog | Path) -> Path:
-    """Get the root path of the cog"""
+    """Get the root path of the cog
+
+    A registration resolves this several times (path checks, env building,
+    app name lookups), so the result is cached per cog instance to avoid
+    repeating the module introspection and path construction.
+    """
     if isinstance(cog_instance, Path):
         return cog_instance
-    return Path(inspect.getfile(cog_instance.__class__)).parent
+    root = _root_cache.get(cog_instance)
+    if root is None:
+        root = Path(inspect.getfile(cog_instance.__class__)).parent
+        _root_cache[cog_instance] = root
+    return root
 
 
 def is_unc_path(path: Path) -> bool:
@@ -26,8 +62,13 @@ def is_windows() -> bool:
     return os.name == "nt"
 
 
+@functools.lru_cache(maxsize=1)
 def find_piccolo_executable() -> Path:
-    """Find the piccolo executable in the system's PATH."""
+    """Find the piccolo executable in the system's PATH.
+
+    The location can't change during the process lifetime, so the result is
+    cached and only the first call pays for the filesystem walk.
+    """
     for path in os.environ["PATH"].split(os.pathsep):
         for executable_name in ["piccolo", "piccolo.exe"]:
             executable = Path(path) / executable_name
@@ -51,6 +92,26 @@ def find_piccolo_executable() -> Path:
     raise FileNotFoundError("Piccolo package not found!")
 
 
+@functools.lru_cache(maxsize=1)
+def get_piccolo_executable_str() -> str:
+    """Get the piccolo executable path as a cached string for subprocess argv."""
+    return str(find_piccolo_executable())
+
+
+def migration_argv(cog_instance: commands.Cog | Path, subcommand: str) -> list[str]:
+    """Build the argv for a `piccolo migrations <subcommand>` CLI invocation.
+
+    The executable string and the cog root are both cached, so repeated
+    fallback invocations only pay for assembling the list itself.
+    """
+    return [
+        get_piccolo_executable_str(),
+        "migrations",
+        subcommand,
+        get_root(cog_instance).stem,
+    ]
+
+
 def get_env(cog_instance: commands.Cog | Path, postgres_config: dict = None) -> dict:
     """Create mock environment for subprocess"""
     env = os.environ.copy()
@@ -58,6 +119,13 @@ def get_env(cog_instance: commands.Cog | Path, postgres_config: dict = None) ->
         # Dont want to overwrite the user's config
         env["PICCOLO_CONF"] = "db.piccolo_conf"
     env["APP_NAME"] = get_root(cog_instance).stem
+    # Cog folders are often read-only or lack __pycache__, so point the
+    # subprocess at a shared writable cache; the piccolo_conf/piccolo_app
+    # bytecode then stays warm across cogs and restarts
+    env.setdefault(
+        "PYTHONPYCACHEPREFIX",
+        str(Path(tempfile.gettempdir()) / "redbot_orm_pycache"),
+    )
     if isinstance(cog_instance, Path):
         env["DB_PATH"] = str(cog_instance / "db.sqlite")
     else:
@@ -73,22 +141,128 @@ def get_env(cog_instance: commands.Cog | Path, postgres_config: dict = None) ->
     return env
 
 
+# Single pass over migration output instead of multiple substring scans;
+# group 1 means nothing to do, group 2 means a migration blew up
+MIGRATION_RESULT_RE = re.compile(r"(No migrations need to be run)|(Traceback)")
+
+
+def piccolo_diagnose() -> None:
+    """In-process equivalent of `piccolo --diagnose`"""
+    print("Diagnosis...")
+    if Finder(diagnose=True).get_app_registry():
+        print("Everything OK")
+
+
+_piccolo_lock = asyncio.Lock()
+
+
+async def run_piccolo(
+    cog_instance: commands.Cog | Path,
+    command,
+    *args,
+    postgres_config: dict = None,
+    **kwargs,
+) -> str:
+    """Run a piccolo migration command in-process instead of shelling out.
+
+    Spawning the piccolo CLI pays interpreter startup, app discovery and a
+    fresh database connection on every call. This calls the same command
+    coroutine directly in the running event loop and captures its output,
+    preserving the str return contract of the CLI path.
+
+    The cog's piccolo_conf/piccolo_app modules read the mock environment at
+    import time, so the environment is swapped in (and the modules imported
+    during the run are dropped again afterwards) under a lock to keep the
+    same isolation the subprocess had.
+
+    Args:
+        cog_instance (commands.Cog | Path): The instance/path of the cog.
+        command: The piccolo command function (sync or async) to invoke.
+        *args: Positional arguments for the command.
+        postgres_config (dict, optional): Database connection details to expose
+            to the cog's piccolo_conf via the environment. Defaults to None.
+        **kwargs: Keyword arguments for the command.
+
+    Returns:
+        str: Everything the command printed, including any traceback.
+    """
+    buffer = io.StringIO()
+    env = get_env(cog_instance, postgres_config)
+    root = str(get_root(cog_instance))
+    async with _piccolo_lock:
+        saved_env = {
+            k: os.environ.get(k) for k, v in env.items() if os.environ.get(k) != v
+        }
+        os.environ.update({k: env[k] for k in saved_env})
+        sys.path.insert(0, root)
+        modules_before = set(sys.modules)
+        try:
+            with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(
+                buffer
+            ):
+                try:
+                    result = command(*args, **kwargs)
+                    if inspect.isawaitable(result):
+                        await result
+                except SystemExit:
+                    # Piccolo commands sys.exit(1) on failure, the output
+                    # already holds the error details
+                    pass
+                except Exception:
+                    traceback.print_exc(file=buffer)
+        finally:
+            with contextlib.suppress(ValueError):
+                sys.path.remove(root)
+            for name, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            # Drop modules imported during the run (the cog's piccolo_conf and
+            # piccolo_app) so the next cog re-imports against its own env.
+            # Only the conf module and modules living under the cog root are
+            # evicted; anything else that happened to be imported concurrently
+            # (other cogs loading, lazy stdlib imports) is left alone.
+            conf_top = env["PICCOLO_CONF"].split(".")[0]
+            root_prefix = root.rstrip(os.sep) + os.sep
+            for name in set(sys.modules) - modules_before:
+                if name.split(".")[0] == conf_top:
+                    sys.modules.pop(name, None)
+                    continue
+                module_file = getattr(sys.modules.get(name), "__file__", None)
+                if module_file and module_file.startswith(root_prefix):
+                    sys.modules.pop(name, None)
+    return buffer.getvalue()
+
+
 async def run_shell(
     cog_instance: commands.Cog | Path,
     commands: list[str],
-    is_shell: bool,
+    tail_lines: int = 500,
 ) -> str:
-    """Run a shell command in a separate thread"""
-
-    def _exe() -> str:
-        res = subprocess.run(
-            commands,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            shell=is_shell,
-            cwd=str(get_root(cog_instance)),
-            env=get_env(cog_instance),
-        )
-        return res.stdout.decode(encoding="utf-8", errors="ignore").replace("👍", "!")
-
-    return await asyncio.to_thread(_exe)
+    """Run a piccolo CLI command, streaming its output line by line.
+
+    Callers only scan the output for small tokens, so instead of buffering
+    arbitrarily large migration output into one string, lines are streamed as
+    they arrive and only the last ``tail_lines`` are kept for context.
+    Stderr is merged into the stream since that's where piccolo prints
+    tracebacks, which callers look for to detect failed migrations.
+
+    The argv is executed directly (no shell) with close_fds=False: we control
+    the argv, the piccolo process is short-lived, and skipping the close-every-
+    fd walk lets Python dispatch through posix_spawn on Linux.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *commands,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        cwd=str(get_root(cog_instance)),
+        env=get_env(cog_instance),
+        limit=1024 * 1024,
+        close_fds=False,
+    )
+    tail: deque[str] = deque(maxlen=tail_lines)
+    async for line in proc.stdout:
+        tail.append(line.decode(encoding="utf-8", errors="ignore"))
+    await proc.wait()
+    return "".join(tail).replace("👍", "!")
@@ -1,17 +1,106 @@
 import asyncio
+import contextlib
+import hashlib
 import logging
+import os
+import re
 from pathlib import Path
 
 import asyncpg
+from asyncpg.utils import _quote_ident as quote_ident
 from discord.ext import commands
+from piccolo.apps.migrations.tables import Migration
 from piccolo.engine.postgres import PostgresEngine
 from piccolo.table import Table
 
-from .common import find_piccolo_executable, get_root, is_unc_path, run_shell
+from .common import (
+    MIGRATION_RESULT_RE,
+    PICCOLO_API_AVAILABLE,
+    get_piccolo_executable_str,
+    get_root,
+    migration_argv,
+    is_unc_path,
+    piccolo_backwards,
+    piccolo_check,
+    piccolo_diagnose,
+    piccolo_forwards,
+    piccolo_new,
+    run_piccolo,
+    run_shell,
+)
 from .errors import ConnectionTimeoutError, DirectoryError, UNCPathError
 
 log = logging.getLogger("red.orm.postgres")
 
+# Baseline connections established up-front when a pool starts. A cold pool
+# with min_size=1 made bursts of Discord events pay the TCP+auth handshake on
+# the request path; warming a few connections eagerly moves that cost to
+# startup where asyncpg establishes them concurrently. Capped at 8 because
+# cpu_count() reports host cores (even in containers) and every registered
+# cog holds min_size connections permanently — uncapped, a many-core VPS
+# running a handful of cogs would exhaust managed Postgres connection limits.
+DEFAULT_MIN_POOL_SIZE = min(max(4, os.cpu_count() or 1), 8)
+
+# Only this many cogs go through the expensive ensure-db/migrate/pool-start
+# phase at once. N cogs each opening up to max_size connections in parallel
+# can blow past managed Postgres connection limits (often just 100).
+_REGISTER_SEM = asyncio.Semaphore(int(os.getenv("REDORM_REGISTER_CONCURRENCY", "4")))
+
+# Tiny pool reused for admin queries (database creation checks etc.) so each
+# cog registration doesn't pay the TCP+auth handshake for a one-shot connection.
+# asyncpg pools are bound to the loop that created them, so the creating loop
+# is tracked alongside the pool and the pool is rebuilt whenever callers show
+# up on a different loop (e.g. run_sync creating a fresh loop per call).
+_admin_pool: asyncpg.Pool | None = None
+_admin_pool_key: tuple | None = None
+_admin_pool_loop: asyncio.AbstractEventLoop | None = None
+_admin_pool_lock: asyncio.Lock | None = None
+
+
+async def _get_admin_pool(config: dict) -> asyncpg.Pool:
+    """Get (or lazily create) the shared admin connection pool.
+
+    The pool holds at most one connection and drops it after 30 seconds of
+    inactivity, so it costs nothing at steady state while letting many cogs
+    registering on startup share a single handshake. A pool created on a
+    previous (now closed) event loop is discarded and recreated on the
+    current one.
+
+    Args:
+        config (dict): The database connection information
+
+    Returns:
+        asyncpg.Pool: The shared admin pool
+    """
+    global _admin_pool, _admin_pool_key, _admin_pool_loop, _admin_pool_lock
+    loop = asyncio.get_running_loop()
+    if _admin_pool_loop is not loop:
+        # The lock (and any cached pool) belong to another loop; awaiting
+        # either from here would blow up, so drop them. No await happens
+        # before the lock is swapped, making this section atomic on the loop.
+        if _admin_pool is not None:
+            # close() needs the old loop, which is likely already dead
+            with contextlib.suppress(Exception):
+                _admin_pool.terminate()
+            _admin_pool = None
+            _admin_pool_key = None
+        _admin_pool_lock = asyncio.Lock()
+        _admin_pool_loop = loop
+    key = tuple(sorted((str(k), str(v)) for k, v in config.items()))
+    async with _admin_pool_lock:
+        if _admin_pool is None or _admin_pool_key != key:
+            if _admin_pool is not None:
+                await _admin_pool.close()
+            _admin_pool = await asyncpg.create_pool(
+                **config,
+                min_size=0,
+                max_size=1,
+                max_inactive_connection_lifetime=30,
+                timeout=10,
+            )
+            _admin_pool_key = key
+    return _admin_pool
+
 
 async def register_cog(
     cog_instance: commands.Cog | Path,
@@ -20,9 +109,11 @@ async def register_cog(
     *,
     trace: bool = False,
     max_size: int = 20,
-    min_size: int = 1,
+    min_size: int = DEFAULT_MIN_POOL_SIZE,
     skip_migrations: bool = False,
     extensions: list[str] = ("uuid-ossp",),
+    statement_cache_size: int = 1024,
+    max_inactive_connection_lifetime: float = 300.0,
 ) -> PostgresEngine:
     """Registers a Discord cog with a database connection and runs migrations.
 
@@ -32,13 +123,20 @@ async def register_cog(
         config (dict): Configuration dictionary containing database connection details.
         trace (bool, optional): Whether to enable tracing for migrations. Defaults to False.
         max_size (int, optional): Maximum size of the database connection pool. Defaults to 20.
-        min_size (int, optional): Minimum size of the database connection pool. Defaults to 1.
+        min_size (int, optional): Minimum size of the database connection pool,
+            pre-connected while the pool starts. Defaults to max(4, cpu count), capped at 8.
         skip_migrations (bool, optional): Whether to skip running migrations. Defaults to False.
         extensions (list[str], optional): List of Postgres extensions to enable. Defaults to ("uuid-ossp",).
+        statement_cache_size (int, optional): Size of asyncpg's per-connection
+            prepared statement cache. Set to 0 when connecting through pgbouncer
+            in transaction mode. Defaults to 1024.
+        max_inactive_connection_lifetime (float, optional): Seconds of inactivity
+            after which the pool closes a connection above min_size. Defaults to 300.
 
     Raises:
         UNCPathError: If the cog path is a UNC path, which is not supported.
         DirectoryError: If the cog files are not in a valid directory.
+        ConnectionTimeoutError: If the connection pool fails to start in time.
 
     Returns:
         PostgresEngine: The database engine associated with the registered cog.
@@ -50,37 +148,225 @@ async def register_cog(
         )
     if not cog_path.is_dir():
         raise DirectoryError(f"Cog files are not in a valid directory: {cog_path}")
+    # The default min_size scales with cpu count and can exceed a caller's
+    # smaller max_size, which asyncpg rejects outright
+    min_size = min(min_size, max_size)
 
-    if await ensure_database_exists(cog_instance, config):
-        log.info(f"New database created for {cog_path.stem}")
+    # Compute these once, the helpers below would otherwise each redo the work
+    database_name = db_name(cog_instance)
+    temp_config = config.copy()
+    temp_config["database"] = database_name
 
-    if not skip_migrations:
-        log.info("Running migrations, if any")
-        result = await run_migrations(cog_instance, config, trace)
-        if "No migrations need to be run" in result:
-            log.info("No migrations needed ✓")
-        else:
-            log.info(f"Migration result...\n{result}")
-            if "Traceback" in result:
-                diagnoses = await diagnose_issues(cog_instance, config)
-                log.error(diagnoses + "\nOne or more migrations failed to run!")
+    async with _REGISTER_SEM:
+        if await ensure_database_exists(cog_instance, config, database_name):
+            log.info(f"New database created for {cog_path.stem}")
 
-    temp_config = config.copy()
-    temp_config["database"] = db_name(cog_instance)
-    log.debug("Fetching database engine")
-    engine = await acquire_db_engine(temp_config, extensions)
-    log.debug("Database engine acquired, starting pool")
-    await engine.start_connection_pool(min_size=min_size, max_size=max_size)
-    log.info("Database connection pool started ✓")
+        if not skip_migrations and await _migrations_up_to_date(temp_config, cog_path):
+            log.info("No migrations needed ✓")
+        elif not skip_migrations:
+            log.info("Running migrations, if any")
+            result = await run_migrations(
+                cog_instance, config, trace, database_name=database_name
+            )
+            match = MIGRATION_RESULT_RE.search(result)
+            if match and match.lastindex == 1:
+                log.info("No migrations needed ✓")
+            else:
+                log.info(f"Migration result...\n{result}")
+                if match:  # Can only be the traceback group
+                    diagnoses = await diagnose_issues(
+                        cog_instance, config, database_name=database_name
+                    )
+                    log.error(diagnoses + "\nOne or more migrations failed to run!")
+
+        await _ensure_extensions(temp_config, extensions)
+        log.debug("Fetching database engine")
+        engine = await acquire_db_engine(temp_config, ())
+        log.debug("Database engine acquired, starting pool")
+        # Unlike the old wait_for around the engine constructor, a timeout
+        # here actually cancels the pool establishment when it fires
+        pool_start = engine.start_connection_pool(
+            min_size=min_size,
+            max_size=max_size,
+            statement_cache_size=statement_cache_size,
+            max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+        )
+        try:
+            if hasattr(asyncio, "timeout"):  # Python 3.11+, cheaper than wait_for
+                async with asyncio.timeout(30):
+                    await pool_start
+            else:
+                await asyncio.wait_for(pool_start, timeout=30)
+        except (TimeoutError, asyncio.TimeoutError):
+            raise ConnectionTimeoutError("Timed out starting the connection pool")
+        log.info("Database connection pool started ✓")
+    # Bind the engine by writing the attribute behind TableMeta's db property
+    # directly, skipping the property/engine_finder machinery per table. Falls
+    # back to the public setter if piccolo ever renames the private attribute.
     for table_class in tables:
-        table_class._meta.db = engine
+        meta = table_class._meta
+        if hasattr(meta, "_db"):
+            meta._db = engine
+        else:
+            meta.db = engine
     return engine
 
 
+async def register_cogs(
+    cogs_and_tables: list[tuple[commands.Cog | Path, list[type[Table]]]],
+    config: dict,
+    *,
+    trace: bool = False,
+    max_size: int = 20,
+    min_size: int = DEFAULT_MIN_POOL_SIZE,
+    skip_migrations: bool = False,
+    extensions: list[str] = ("uuid-ossp",),
+    statement_cache_size: int = 1024,
+    max_inactive_connection_lifetime: float = 300.0,
+) -> list[PostgresEngine]:
+    """Registers multiple Discord cogs concurrently, sharing the admin pool.
+
+    Args:
+        cogs_and_tables (list[tuple[commands.Cog | Path, list[type[Table]]]]): Pairs of
+            cog instance/path and the Table classes to associate with its engine.
+        config (dict): Configuration dictionary containing database connection details.
+        trace (bool, optional): Whether to enable tracing for migrations. Defaults to False.
+        max_size (int, optional): Maximum size of each database connection pool. Defaults to 20.
+        min_size (int, optional): Minimum size of each database connection pool,
+            pre-connected while the pool starts. Defaults to max(4, cpu count), capped at 8.
+        skip_migrations (bool, optional): Whether to skip running migrations. Defaults to False.
+        extensions (list[str], optional): List of Postgres extensions to enable. Defaults to ("uuid-ossp",).
+        statement_cache_size (int, optional): Size of asyncpg's per-connection
+            prepared statement cache. Set to 0 when connecting through pgbouncer
+            in transaction mode. Defaults to 1024.
+        max_inactive_connection_lifetime (float, optional): Seconds of inactivity
+            after which the pool closes a connection above min_size. Defaults to 300.
+
+    Returns:
+        list[PostgresEngine]: The database engines, in the same order as the input pairs.
+    """
+    min_size = min(min_size, max_size)
+    return list(
+        await asyncio.gather(
+            *(
+                register_cog(
+                    cog_instance,
+                    tables,
+                    config,
+                    trace=trace,
+                    max_size=max_size,
+                    min_size=min_size,
+                    skip_migrations=skip_migrations,
+                    extensions=extensions,
+                    statement_cache_size=statement_cache_size,
+                    max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+                )
+                for cog_instance, tables in cogs_and_tables
+            )
+        )
+    )
+
+
+async def _ensure_extensions(temp_config: dict, extensions: list[str]) -> None:
+    """Create the requested Postgres extensions in the cog's database.
+
+    Piccolo's engine issues one CREATE EXTENSION round trip per extension from
+    its blocking constructor; batching them into a single multi-statement
+    execute up front does the same work in one round trip, and the engine can
+    then be built with extensions=(). Failures are logged and ignored, same as
+    piccolo's own behavior when the user lacks superuser rights.
+
+    Args:
+        temp_config (dict): Connection details for the cog's own database.
+        extensions (list[str]): The Postgres extensions to enable.
+    """
+    if not extensions:
+        return
+    sql = ";".join(
+        f"CREATE EXTENSION IF NOT EXISTS {quote_ident(ext)}" for ext in extensions
+    )
+    try:
+        conn = await asyncpg.connect(**temp_config, timeout=10)
+    except (OSError, asyncio.TimeoutError, asyncpg.PostgresError):
+        # asyncio.TimeoutError is only an OSError subclass from 3.11 on
+        log.warning("Could not connect to pre-create extensions", exc_info=True)
+        return
+    try:
+        await conn.execute(sql)
+    except asyncpg.PostgresError:
+        log.warning(f"Failed to create extensions {extensions}", exc_info=True)
+    finally:
+        await conn.close()
+
+
+async def _migrations_up_to_date(temp_config: dict, cog_path: Path) -> bool:
+    """Check whether every on-disk migration has already been recorded as run.
+
+    In the steady state a cog loads with nothing to migrate, so comparing the
+    rows piccolo's migration tracking table holds for the app against the
+    migration modules on disk lets register_cog skip the migration machinery
+    entirely. Returns False whenever in doubt (no migrations folder, missing
+    table, fresh database), in which case the real migration command runs
+    and decides.
+
+    Args:
+        temp_config (dict): Connection details for the cog's own database.
+        cog_path (Path): The root path of the cog.
+
+    Returns:
+        bool: True if the migration step can safely be skipped.
+    """
+    candidates = (
+        cog_path / "db" / "migrations",
+        cog_path / "migrations",
+        cog_path / "piccolo_migrations",
+    )
+    for candidate in candidates:
+        if candidate.is_dir():
+            migration_dir = candidate
+            break
+    else:
+        return False
+
+    on_disk = 0
+    with os.scandir(migration_dir) as entries:
+        for entry in entries:
+            if (
+                entry.name.endswith(".py")
+                and entry.name != "__init__.py"
+                and entry.is_file()
+            ):
+                on_disk += 1
+    if not on_disk:
+        # First run still needs to create the migration tracking table
+        return False
+
+    try:
+        conn = await asyncpg.connect(**temp_config, timeout=10)
+    except (OSError, asyncio.TimeoutError, asyncpg.PostgresError):
+        # On Python 3.10 a connect timeout surfaces as asyncio.TimeoutError,
+        # which is not an OSError subclass until 3.11
+        return False
+    try:
+        # The tablename comes from piccolo's own Migration table ("migration")
+        # so this can't drift from what the forwards command actually writes
+        ran = await conn.fetchval(
+            f"SELECT count(*) FROM {quote_ident(Migration._meta.tablename)}"
+            " WHERE app_name = $1;",
+            cog_path.stem,
+        )
+    except asyncpg.PostgresError:
+        return False
+    finally:
+        await conn.close()
+    return ran == on_disk
+
+
 async def run_migrations(
     cog_instance: commands.Cog | Path,
     config: dict,
     trace: bool = False,
+    database_name: str = None,
 ) -> str:
     """Runs database migrations for a given Discord cog.
 
@@ -88,21 +374,26 @@ async def run_migrations(
         cog_instance (commands.Cog | Path): The instance of the cog for which to run migrations.
         config (dict): Database connection details.
         trace (bool, optional): Whether to enable tracing for migrations. Defaults to False.
+        database_name (str, optional): Precomputed database name for the cog. Defaults to None.
 
     Returns:
         str: The result of the migration process, including any output messages.
     """
+    if database_name is None:
+        database_name = db_name(cog_instance)
     temp_config = config.copy()
-    temp_config["database"] = db_name(cog_instance)
-    commands = [
-        str(find_piccolo_executable()),
-        "migrations",
-        "forwards",
-        get_root(cog_instance).stem,
-    ]
+    temp_config["database"] = database_name
+    if PICCOLO_API_AVAILABLE:
+        return await run_piccolo(
+            cog_instance,
+            piccolo_forwards,
+            get_root(cog_instance).stem,
+            postgres_config=temp_config,
+        )
+    commands = migration_argv(cog_instance, "forwards")
     if trace:
         commands.append("--trace")
-    return await run_shell(cog_instance, commands, False)
+    return await run_shell(cog_instance, commands)
 
 
 async def reverse_migration(
@@ -110,6 +401,7 @@ async def reverse_migration(
     config: dict,
     timestamp: str,
     trace: bool = False,
+    database_name: str = None,
 ) -> str:
     """Reverses a database migration for a given Discord cog to a specific timestamp.
 
@@ -118,22 +410,29 @@ async def reverse_migration(
         config (dict): Configuration dictionary containing database connection details.
         timestamp (str): The timestamp to which the migration should be reversed.
         trace (bool, optional): Whether to enable tracing for migrations. Defaults to False.
+        database_name (str, optional): Precomputed database name for the cog. Defaults to None.
 
     Returns:
         str: The result of the reverse migration process, including any output messages.
     """
+    if database_name is None:
+        database_name = db_name(cog_instance)
     temp_config = config.copy()
-    temp_config["database"] = db_name(cog_instance)
-    commands = [
-        str(find_piccolo_executable()),
-        "migrations",
-        "backwards",
-        get_root(cog_instance).stem,
-        timestamp,
-    ]
+    temp_config["database"] = database_name
+    if PICCOLO_API_AVAILABLE:
+        return await run_piccolo(
+            cog_instance,
+            piccolo_backwards,
+            get_root(cog_instance).stem,
+            migration_id=timestamp,
+            auto_agree=True,
+            postgres_config=temp_config,
+        )
+    commands = migration_argv(cog_instance, "backwards")
+    commands.append(timestamp)
     if trace:
         commands.append("--trace")
-    return await run_shell(cog_instance, commands, False)
+    return await run_shell(cog_instance, commands)
 
 
 async def create_migrations(
@@ -141,6 +440,7 @@ async def create_migrations(
     config: dict,
     trace: bool = False,
     description: str = None,
+    database_name: str = None,
 ) -> str:
     """Creates new database migrations for the cog
 
@@ -151,48 +451,63 @@ async def create_migrations(
         config (dict): Configuration dictionary containing database connection details.
         trace (bool, optional): Whether to enable tracing for migrations. Defaults to False.
         description (str, optional): Description of the migration. Defaults to None.
+        database_name (str, optional): Precomputed database name for the cog. Defaults to None.
 
     Returns:
         str: The result of the migration creation process, including any output messages.
     """
+    if database_name is None:
+        database_name = db_name(cog_instance)
     temp_config = config.copy()
-    temp_config["database"] = db_name(cog_instance)
-    commands = [
-        str(find_piccolo_executable()),
-        "migrations",
-        "new",
-        get_root(cog_instance).stem,
-        "--auto",
-    ]
+    temp_config["database"] = database_name
+    if PICCOLO_API_AVAILABLE:
+        return await run_piccolo(
+            cog_instance,
+            piccolo_new,
+            get_root(cog_instance).stem,
+            auto=True,
+            desc=description or "",
+            postgres_config=temp_config,
+        )
+    commands = migration_argv(cog_instance, "new")
+    commands.append("--auto")
     if trace:
         commands.append("--trace")
     if description is not None:
         commands.append(f"--desc={description}")
-    return await run_shell(cog_instance, commands, True)
+    return await run_shell(cog_instance, commands)
 
 
-async def diagnose_issues(cog_instance: commands.Cog | Path, config: dict) -> str:
+async def diagnose_issues(
+    cog_instance: commands.Cog | Path,
+    config: dict,
+    database_name: str = None,
+) -> str:
     """Diagnoses potential issues with the database setup for a given Discord cog.
 
     Args:
         cog_instance (commands.Cog | Path): The instance of the cog to diagnose.
         config (dict): Configuration dictionary containing database connection details.
+        database_name (str, optional): Precomputed database name for the cog. Defaults to None.
 
     Returns:
         str: The result of the diagnosis process, including any output messages.
     """
-    piccolo_path = find_piccolo_executable()
+    if database_name is None:
+        database_name = db_name(cog_instance)
     temp_config = config.copy()
-    temp_config["database"] = db_name(cog_instance)
-    diagnoses = await run_shell(
-        cog_instance,
-        [str(piccolo_path), "--diagnose"],
-        False,
-    )
-    check = await run_shell(
-        cog_instance,
-        [str(piccolo_path), "migrations", "check"],
-        False,
+    temp_config["database"] = database_name
+    # The two checks are independent, run them concurrently
+    if PICCOLO_API_AVAILABLE:
+        diagnoses, check = await asyncio.gather(
+            run_piccolo(cog_instance, piccolo_diagnose, postgres_config=temp_config),
+            run_piccolo(cog_instance, piccolo_check, postgres_config=temp_config),
+        )
+        return f"{diagnoses}\n{check}"
+    piccolo_path = get_piccolo_executable_str()
+    diagnoses, check = await asyncio.gather(
+        run_shell(cog_instance, [piccolo_path, "--diagnose"]),
+        run_shell(cog_instance, [piccolo_path, "migrations", "check"]),
     )
     return f"{diagnoses}\n{check}"
 
@@ -200,31 +515,40 @@ async def diagnose_issues(cog_instance: commands.Cog | Path, config: dict) -> st
 async def ensure_database_exists(
     cog_instance: commands.Cog | Path,
     config: dict,
+    database_name: str = None,
 ) -> bool:
     """Create a database for the cog if it doesn't exist.
 
     Args:
         cog_instance (commands.Cog | Path): The cog instance
         config (dict): the database connection information
+        database_name (str, optional): Precomputed database name for the cog. Defaults to None.
 
     Returns:
         bool: True if a new database was created
     """
-    conn = await asyncpg.connect(**config, timeout=10)
-    database_name = db_name(cog_instance)
-    try:
-        databases = await conn.fetch("SELECT datname FROM pg_database;")
-        if database_name not in [db["datname"] for db in databases]:
-            await conn.execute(f"CREATE DATABASE {database_name};")
+    pool = await _get_admin_pool(config)
+    if database_name is None:
+        database_name = db_name(cog_instance)
+    async with pool.acquire() as conn:
+        # Indexed lookup server-side instead of fetching every row of pg_database
+        exists = await conn.fetchval(
+            "SELECT 1 FROM pg_database WHERE datname = $1;", database_name
+        )
+        if not exists:
+            # CREATE DATABASE can't take parameters, so quote the identifier
+            await conn.execute(f"CREATE DATABASE {quote_ident(database_name)};")
             return True
-    finally:
-        await conn.close()
     return False
 
 
 async def acquire_db_engine(config: dict, extensions: list[str]) -> PostgresEngine:
     """Acquire a database engine
-    The PostgresEngine constructor is blocking and must be run in a separate thread.
+    The PostgresEngine constructor is blocking (it connects to check the server
+    version) and must be run in a separate thread. No asyncio.wait_for wrapper:
+    cancelling the awaiter can't interrupt the blocking constructor, it just
+    leaked the worker thread. True connection timeouts should be applied to
+    start_connection_pool instead.
 
     Args:
         config (dict): The database connection information
@@ -233,23 +557,25 @@ async def acquire_db_engine(config: dict, extensions: list[str]) -> PostgresEngi
     Returns:
         PostgresEngine: The database engine
     """
+    return await asyncio.to_thread(
+        PostgresEngine,
+        config=config,
+        extensions=extensions,
+    )
 
-    async def get_conn():
-        return await asyncio.to_thread(
-            PostgresEngine,
-            config=config,
-            extensions=extensions,
-        )
 
-    try:
-        return await asyncio.wait_for(get_conn(), timeout=10)
-    except asyncio.TimeoutError:
-        raise ConnectionTimeoutError("Database connection timed out")
+# Postgres identifiers: lowercase letter/underscore start, max 63 bytes
+_IDENT_RE = re.compile(r"^[a-z_][a-z0-9_]{0,62}$")
 
 
 def db_name(cog_instance: commands.Cog | Path) -> str:
     """Get the name of the database for the cog
 
+    Cog names that don't form a valid Postgres identifier are sanitized
+    deterministically (invalid characters replaced with underscores plus a
+    short hash suffix of the original), so the same cog always maps to the
+    same database instead of failing to parse on every startup.
+
     Args:
         cog_instance (commands.Cog | Path): The cog instance
 
@@ -257,5 +583,13 @@ def db_name(cog_instance: commands.Cog | Path) -> str:
         str: The database name
     """
     if isinstance(cog_instance, Path):
-        return cog_instance.stem.lower()
-    return cog_instance.qualified_name.lower()
+        name = cog_instance.stem.lower()
+    else:
+        name = cog_instance.qualified_name.lower()
+    if _IDENT_RE.match(name):
+        return name
+    sanitized = re.sub(r"[^a-z0-9_]", "_", name)
+    if not sanitized or sanitized[0].isdigit():
+        sanitized = f"_{sanitized}"
+    suffix = hashlib.blake2b(name.encode(), digest_size=4).hexdigest()
+    return f"{sanitized[:54]}_{suffix}"
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from pathlib import Path
 
@@ -6,7 +7,21 @@ from piccolo.engine.sqlite import SQLiteEngine
 from piccolo.table import Table
 from redbot.core.data_manager import cog_data_path
 
-from .common import find_piccolo_executable, get_root, is_unc_path, run_shell
+from .common import (
+    MIGRATION_RESULT_RE,
+    PICCOLO_API_AVAILABLE,
+    get_piccolo_executable_str,
+    get_root,
+    migration_argv,
+    is_unc_path,
+    piccolo_backwards,
+    piccolo_check,
+    piccolo_diagnose,
+    piccolo_forwards,
+    piccolo_new,
+    run_piccolo,
+    run_shell,
+)
 from .errors import DirectoryError, UNCPathError
 
 log = logging.getLogger("red.orm.sqlite")
@@ -54,18 +69,26 @@ async def register_cog(
     if not skip_migrations:
         log.info("Running migrations, if any")
         result = await run_migrations(cog_instance, trace)
-        if "No migrations need to be run" in result:
+        match = MIGRATION_RESULT_RE.search(result)
+        if match and match.lastindex == 1:
             log.info("No migrations needed!")
         else:
             log.info(f"Migration result...\n{result}")
-            if "Traceback" in result:
+            if match:  # Can only be the traceback group
                 diagnoses = await diagnose_issues(cog_instance)
                 log.error(diagnoses + "\nOne or more migrations failed to run!")
 
     log.debug("Fetching database engine")
     db = SQLiteEngine(path=str(save_path / "db.sqlite"))
+    # Bind the engine by writing the attribute behind TableMeta's db property
+    # directly, skipping the property/engine_finder machinery per table. Falls
+    # back to the public setter if piccolo ever renames the private attribute.
     for table_class in tables:
-        table_class._meta.db = db
+        meta = table_class._meta
+        if hasattr(meta, "_db"):
+            meta._db = db
+        else:
+            meta.db = db
     return db
 
 
@@ -82,15 +105,16 @@ async def run_migrations(
     Returns:
         str: The result of the migration process, including any output messages.
     """
-    commands = [
-        str(find_piccolo_executable()),
-        "migrations",
-        "forwards",
-        get_root(cog_instance).stem,
-    ]
+    if PICCOLO_API_AVAILABLE:
+        return await run_piccolo(
+            cog_instance,
+            piccolo_forwards,
+            get_root(cog_instance).stem,
+        )
+    commands = migration_argv(cog_instance, "forwards")
     if trace:
         commands.append("--trace")
-    return await run_shell(cog_instance, commands, False)
+    return await run_shell(cog_instance, commands)
 
 
 async def reverse_migration(
@@ -108,16 +132,19 @@ async def reverse_migration(
     Returns:
         str: The result of the migration process, including any output messages.
     """
-    commands = [
-        str(find_piccolo_executable()),
-        "migrations",
-        "backwards",
-        get_root(cog_instance).stem,
-        timestamp,
-    ]
+    if PICCOLO_API_AVAILABLE:
+        return await run_piccolo(
+            cog_instance,
+            piccolo_backwards,
+            get_root(cog_instance).stem,
+            migration_id=timestamp,
+            auto_agree=True,
+        )
+    commands = migration_argv(cog_instance, "backwards")
+    commands.append(timestamp)
     if trace:
         commands.append("--trace")
-    return await run_shell(cog_instance, commands, False)
+    return await run_shell(cog_instance, commands)
 
 
 async def create_migrations(
@@ -136,18 +163,21 @@ async def create_migrations(
     Returns:
         str: The result of the migration process, including any output messages.
     """
-    commands = [
-        str(find_piccolo_executable()),
-        "migrations",
-        "new",
-        get_root(cog_instance).stem,
-        "--auto",
-    ]
+    if PICCOLO_API_AVAILABLE:
+        return await run_piccolo(
+            cog_instance,
+            piccolo_new,
+            get_root(cog_instance).stem,
+            auto=True,
+            desc=description or "",
+        )
+    commands = migration_argv(cog_instance, "new")
+    commands.append("--auto")
     if trace:
         commands.append("--trace")
     if description is not None:
         commands.append(f"--desc={description}")
-    return await run_shell(cog_instance, commands, True)
+    return await run_shell(cog_instance, commands)
 
 
 async def diagnose_issues(cog_instance: commands.Cog | Path) -> str:
@@ -159,15 +189,16 @@ async def diagnose_issues(cog_instance: commands.Cog | Path) -> str:
     Returns:
         str: The result of the diagnosis process, including any output messages.
     """
-    piccolo_path = find_piccolo_executable()
-    diagnoses = await run_shell(
-        cog_instance,
-        [str(piccolo_path), "--diagnose"],
-        False,
-    )
-    check = await run_shell(
-        cog_instance,
-        [str(piccolo_path), "migrations", "check"],
-        False,
+    # The two checks are independent, run them concurrently
+    if PICCOLO_API_AVAILABLE:
+        diagnoses, check = await asyncio.gather(
+            run_piccolo(cog_instance, piccolo_diagnose),
+            run_piccolo(cog_instance, piccolo_check),
+        )
+        return f"{diagnoses}\n{check}"
+    piccolo_path = get_piccolo_executable_str()
+    diagnoses, check = await asyncio.gather(
+        run_shell(cog_instance, [piccolo_path, "--diagnose"]),
+        run_shell(cog_instance, [piccolo_path, "migrations", "check"]),
     )
     return f"{diagnoses}\n{check}"
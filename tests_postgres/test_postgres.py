@@ -6,6 +6,8 @@ from dotenv import load_dotenv
 from piccolo.engine.postgres import PostgresEngine
 from piccolo.utils.sync import run_sync
 from redbot_orm.postgres import (
+    _IDENT_RE,
+    _migrations_up_to_date,
     acquire_db_engine,
     create_migrations,
     db_name,
@@ -87,6 +89,24 @@ class TestPostgres(TestCase):
         res = run_sync(run_migrations(cog_instance, get_connection_info()))
         self.assertIsInstance(res, str, "Should return a string")
 
+    def test_migrations_up_to_date(self):
+        temp_config = get_connection_info()
+        temp_config["database"] = db_name(cog_instance)
+        self.assertFalse(
+            run_sync(_migrations_up_to_date(temp_config, cog_instance)),
+            "Fresh database should not report migrations as up to date",
+        )
+        run_sync(
+            create_migrations(
+                cog_instance, get_connection_info(), description="Fast path"
+            )
+        )
+        run_sync(register_cog(cog_instance, TABLES, get_connection_info()))
+        self.assertTrue(
+            run_sync(_migrations_up_to_date(temp_config, cog_instance)),
+            "Fast path should skip once all migrations have run",
+        )
+
     def test_diagnose_issues(self):
         res = run_sync(diagnose_issues(cog_instance, get_connection_info()))
         self.assertIsInstance(res, str, "Should return a string")
@@ -112,3 +132,30 @@ class TestPostgres(TestCase):
         self.assertEqual(
             db_name(mock_cog), "testcog", "Should return lowercase cog name"
         )
+
+    def test_db_name_sanitizes_special_characters(self):
+        class MockCog:
+            qualified_name = "Weird Cog-Name!"
+
+        name = db_name(MockCog())
+        self.assertEqual(name, db_name(MockCog()), "Should be deterministic")
+        self.assertRegex(name, _IDENT_RE, "Should be a valid identifier")
+        self.assertLessEqual(len(name), 63, "Should fit Postgres name limit")
+
+    def test_db_name_sanitizes_leading_digit(self):
+        class MockCog:
+            qualified_name = "9Lives"
+
+        name = db_name(MockCog())
+        self.assertEqual(name, db_name(MockCog()), "Should be deterministic")
+        self.assertRegex(name, _IDENT_RE, "Should be a valid identifier")
+        self.assertLessEqual(len(name), 63, "Should fit Postgres name limit")
+
+    def test_db_name_truncates_long_names(self):
+        class MockCog:
+            qualified_name = "VeryLongCogName" * 10
+
+        name = db_name(MockCog())
+        self.assertEqual(name, db_name(MockCog()), "Should be deterministic")
+        self.assertRegex(name, _IDENT_RE, "Should be a valid identifier")
+        self.assertLessEqual(len(name), 63, "Should fit Postgres name limit")